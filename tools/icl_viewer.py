@@ -13,6 +13,8 @@ import os
 import subprocess
 import struct
 import io
+import functools
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 # ---------------------------------------------------------------------------
@@ -20,7 +22,7 @@ from pathlib import Path
 # ---------------------------------------------------------------------------
 
 VENV_DIR = Path(__file__).resolve().parent / ".icl_viewer_venv"
-REQUIRED_PACKAGES = ["pefile", "Pillow", "PyQt6"]
+REQUIRED_PACKAGES = ["pefile", "Pillow", "PyQt6", "numpy"]
 
 
 def bootstrap():
@@ -30,7 +32,7 @@ def bootstrap():
     if not venv_python.exists():
         print("First run — setting up virtual environment...")
         subprocess.check_call([sys.executable, "-m", "venv", str(VENV_DIR)])
-        print("Installing dependencies (pefile, Pillow, PyQt6)...")
+        print("Installing dependencies (pefile, Pillow, PyQt6, numpy)...")
         subprocess.check_call([
             str(venv_python), "-m", "pip", "install", "--quiet", *REQUIRED_PACKAGES
         ])
@@ -49,33 +51,53 @@ if not sys.prefix.startswith(str(VENV_DIR)):
 # ---------------------------------------------------------------------------
 
 import pefile
+try:
+    import numpy as np
+except ImportError:  # venvs bootstrapped before numpy was a dependency
+    np = None
 from PIL import Image
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
     QGridLayout, QScrollArea, QLabel, QPushButton, QFileDialog,
-    QMessageBox, QSplitter, QFrame, QSizePolicy,
+    QMessageBox, QSplitter, QFrame, QSizePolicy, QProgressDialog, QAbstractButton,
+)
+from PyQt6.QtGui import (
+    QPixmap, QImage, QIcon, QPalette, QColor, QFont, QPainter, QPainterPath,
+)
+from PyQt6.QtCore import (
+    Qt, QByteArray, QBuffer, QObject, QRunnable, QThreadPool, pyqtSignal,
+    QRect, QRectF,
 )
-from PyQt6.QtGui import QPixmap, QImage, QIcon, QPalette, QColor, QFont
-from PyQt6.QtCore import Qt, QSize, QByteArray, QBuffer
 
 
 # ---------------------------------------------------------------------------
 # ICO / icon-resource parsing
 # ---------------------------------------------------------------------------
 
+_GRP_DIR_HDR = struct.Struct("<HHH")             # GRPICONDIR
+_GRP_ENTRY = struct.Struct("<BBBBHHIH")          # GRPICONDIRENTRY
+_BMPINFO_HDR = struct.Struct("<IiiHHIIiiII")     # BITMAPINFOHEADER (40 bytes)
+
+# Mask byte -> 8 alpha bytes, MSB first (set bit = transparent)
+_BIT_TO_ALPHA = [
+    bytes(0 if (b >> i) & 1 else 255 for i in range(7, -1, -1)) for b in range(256)
+]
+
+
 def parse_grp_icon_dir(data: bytes):
-    if len(data) < 6:
+    if len(data) < _GRP_DIR_HDR.size:
         return []
-    _reserved, _type, count = struct.unpack_from("<HHH", data, 0)
+    _reserved, _type, count = _GRP_DIR_HDR.unpack_from(data, 0)
     entries = []
-    offset = 6
+    unpack_entry = _GRP_ENTRY.unpack_from
+    entry_size = _GRP_ENTRY.size
+    data_len = len(data)
+    offset = _GRP_DIR_HDR.size
     for _ in range(count):
-        if offset + 14 > len(data):
+        if offset + entry_size > data_len:
             break
         (width, height, color_count, _reserved,
-         planes, bit_count, bytes_in_res, icon_id) = struct.unpack_from(
-            "<BBBBHHIH", data, offset
-        )
+         planes, bit_count, bytes_in_res, icon_id) = unpack_entry(data, offset)
         entries.append({
             "width": width or 256,
             "height": height or 256,
@@ -85,37 +107,57 @@ def parse_grp_icon_dir(data: bytes):
             "bytes_in_res": bytes_in_res,
             "icon_id": icon_id,
         })
-        offset += 14
+        offset += entry_size
     return entries
 
 
-def icon_resource_to_image(data: bytes):
-    """Convert RT_ICON resource blob to PIL Image (handles PNG and BMP DIB)."""
-    if data[:8] == b"\x89PNG\r\n\x1a\n":
-        return Image.open(io.BytesIO(data)).convert("RGBA")
-
-    if len(data) < 40:
-        return None
+def _ensure_rgba(img):
+    return img if img.mode == "RGBA" else img.convert("RGBA")
 
-    header_size = struct.unpack_from("<I", data, 0)[0]
-    bmp_width = struct.unpack_from("<i", data, 4)[0]
-    bmp_height = struct.unpack_from("<i", data, 8)[0]
-    bit_count = struct.unpack_from("<H", data, 14)[0]
 
-    actual_height = abs(bmp_height) // 2
-    patched_dib = data[:8] + struct.pack("<i", actual_height) + data[12:]
+def _and_mask_to_alpha(mask_data, width: int, height: int, row_size: int):
+    """Turn a bottom-up 1-bpp AND mask into a top-down "L" alpha image."""
+    if np is not None:
+        raw = np.frombuffer(mask_data, dtype=np.uint8).reshape(height, row_size)
+        bits = np.unpackbits(raw, axis=1)[:, :width]
+        bits = bits[::-1]
+        alpha = np.where(bits, 0, 255).astype(np.uint8)
+        return Image.fromarray(alpha, "L")
 
-    colors_used = struct.unpack_from("<I", data, 32)[0]
-    if colors_used == 0 and bit_count <= 8:
-        colors_used = 1 << bit_count
-    palette_size = colors_used * 4
-    pixel_offset = 14 + header_size + palette_size
+    rows = []
+    for row_start in range(0, height * row_size, row_size):
+        row = mask_data[row_start: row_start + row_size]
+        rows.append(b"".join([_BIT_TO_ALPHA[byte] for byte in row])[:width])
+    # Orientation -1 lets Pillow flip the bottom-up rows
+    return Image.frombytes("L", (width, height), b"".join(rows), "raw", "L", 0, -1)
 
-    bmp_header = struct.pack("<2sIHHI", b"BM", 14 + len(patched_dib), 0, 0, pixel_offset)
-    bmp_data = bmp_header + patched_dib
 
+def icon_resource_to_image(data):
+    """Convert RT_ICON resource blob (bytes or memoryview) to PIL Image (handles PNG and BMP DIB)."""
+    # Any decode failure (truncated PNG, bad DIB, ...) yields None so callers
+    # can treat the variant as unreadable instead of raising on a pool thread
     try:
-        img = Image.open(io.BytesIO(bmp_data)).convert("RGBA")
+        if data[:8] == b"\x89PNG\r\n\x1a\n":
+            # Decode fully inside the block so the buffer and decoder are released now
+            with io.BytesIO(data) as fp:
+                img = Image.open(fp)
+                img.load()
+            return _ensure_rgba(img)
+
+        if len(data) < 40:
+            return None
+
+        (header_size, bmp_width, bmp_height, _planes, bit_count, compression,
+         _sizeimg, _xppm, _yppm, colors_used, _clr_imp) = _BMPINFO_HDR.unpack_from(data, 0)
+
+        actual_height = abs(bmp_height) // 2
+
+        if colors_used == 0 and bit_count <= 8:
+            colors_used = 1 << bit_count
+        palette_size = colors_used * 4
+        if compression == 3 and header_size == 40:
+            # BI_BITFIELDS: three DWORD colour masks follow a plain BITMAPINFOHEADER
+            palette_size += 12
 
         xor_row_size = ((bmp_width * bit_count + 31) // 32) * 4
         xor_size = xor_row_size * actual_height
@@ -123,19 +165,36 @@ def icon_resource_to_image(data: bytes):
         mask_offset = header_size + palette_size + xor_size
         mask_size = mask_row_size * actual_height
 
-        if bit_count < 32 and mask_offset + mask_size <= len(data):
-            mask_data = data[mask_offset: mask_offset + mask_size]
-            mask_img = Image.new("L", (bmp_width, actual_height), 255)
-            px = mask_img.load()
-            for y in range(actual_height):
-                row_start = (actual_height - 1 - y) * mask_row_size
-                row = mask_data[row_start: row_start + mask_row_size]
-                for x in range(bmp_width):
-                    byte_idx = x // 8
-                    bit_idx = 7 - (x % 8)
-                    if byte_idx < len(row) and (row[byte_idx] >> bit_idx) & 1:
-                        px[x, y] = 0
-            img.putalpha(mask_img)
+        if bit_count == 32 and compression == 0:  # BI_RGB
+            # Alpha lives in the pixel data, but Pillow's BMP reader returns
+            # BI_RGB 32-bpp as RGBX; unpack the bottom-up BGRA rows directly.
+            img = Image.frombytes(
+                "RGBA", (bmp_width, actual_height), data[header_size + palette_size:],
+                "raw", "BGRA", xor_row_size, -1,
+            )
+            if img.getextrema()[3] != (0, 0):
+                return img
+            # Legacy icon with zeroed alpha: opaque, then let the AND mask cut it out
+            img.putalpha(255)
+        else:
+            patched_dib = b"".join((data[:8], struct.pack("<i", actual_height), data[12:]))
+            pixel_offset = 14 + header_size + palette_size
+            bmp_header = struct.pack("<2sIHHI", b"BM", 14 + len(patched_dib), 0, 0, pixel_offset)
+            bmp_data = bmp_header + patched_dib
+
+            with io.BytesIO(bmp_data) as fp:
+                img = Image.open(fp)
+                img.load()
+            img = _ensure_rgba(img)
+            if bit_count == 32:
+                # BI_BITFIELDS: Pillow applied the colour masks that follow the
+                # header and decoded any alpha itself; leave it as is.
+                return img
+
+        if mask_offset + mask_size <= len(data):
+            # A view, not a copy; _and_mask_to_alpha slices rows out of it
+            mask_data = memoryview(data)[mask_offset: mask_offset + mask_size]
+            img.putalpha(_and_mask_to_alpha(mask_data, bmp_width, actual_height, mask_row_size))
 
         return img
     except Exception:
@@ -143,57 +202,102 @@ def icon_resource_to_image(data: bytes):
 
 
 def load_icons_from_pe(filepath: str):
-    pe = pefile.PE(filepath)
+    # Read the file ourselves rather than letting pefile mmap it: the resource
+    # walk slices zero-copy memoryviews out of these bytes (a mapping with
+    # exported views could not be closed), and only the icon blobs are copied
+    # out once the walk is done, so the rest of the file is not retained.
+    file_data = Path(filepath).read_bytes()
+    pe = pefile.PE(data=file_data)
+
+    base = memoryview(file_data)
+    get_offset = pe.get_offset_from_rva
+
+    def get_data(rva, size):
+        start = get_offset(rva)
+        return base[start: start + size]
 
     icon_data_by_id = {}
+    pending_groups = []  # (group_entry, parsed GRPICONDIR entries)
     if hasattr(pe, "DIRECTORY_ENTRY_RESOURCE"):
         for res_type in pe.DIRECTORY_ENTRY_RESOURCE.entries:
-            if res_type.id == 3 and hasattr(res_type, "directory"):
+            if not hasattr(res_type, "directory"):
+                continue
+            if res_type.id == 3:  # RT_ICON
                 for icon_entry in res_type.directory.entries:
                     if hasattr(icon_entry, "directory"):
                         for lang in icon_entry.directory.entries:
                             rva = lang.data.struct.OffsetToData
                             size = lang.data.struct.Size
-                            icon_data_by_id[icon_entry.id] = pe.get_data(rva, size)
-
-    groups = []
-    if hasattr(pe, "DIRECTORY_ENTRY_RESOURCE"):
-        for res_type in pe.DIRECTORY_ENTRY_RESOURCE.entries:
-            if res_type.id == 14 and hasattr(res_type, "directory"):
+                            icon_data_by_id[icon_entry.id] = get_data(rva, size)
+            elif res_type.id == 14:  # RT_GROUP_ICON
                 for group_entry in res_type.directory.entries:
                     if hasattr(group_entry, "directory"):
                         for lang in group_entry.directory.entries:
                             rva = lang.data.struct.OffsetToData
                             size = lang.data.struct.Size
-                            grp_data = pe.get_data(rva, size)
-                            entries = parse_grp_icon_dir(grp_data)
-                            images = []
-                            for e in entries:
-                                raw = icon_data_by_id.get(e["icon_id"])
-                                if raw:
-                                    img = icon_resource_to_image(raw)
-                                    if img:
-                                        images.append({"entry": e, "image": img})
-                            groups.append({
-                                "group_id": group_entry.id,
-                                "group_name": str(group_entry.name) if group_entry.name else None,
-                                "images": images,
-                            })
+                            entries = parse_grp_icon_dir(get_data(rva, size))
+                            pending_groups.append((group_entry, entries))
+
+    # Own copies of just the icon blobs; this drops every view into file_data
+    icon_data_by_id = {icon_id: bytes(view) for icon_id, view in icon_data_by_id.items()}
     pe.close()
+
+    # Groups are resolved once every RT_ICON is known. Images are not decoded
+    # here: each variant keeps its raw resource bytes and is decoded on first
+    # use by _get_image().
+    groups = []
+    for group_entry, entries in pending_groups:
+        images = []
+        for e in entries:
+            raw = icon_data_by_id.get(e["icon_id"])
+            if raw:
+                images.append({"entry": e, "raw": raw, "image": None})
+        images.sort(key=lambda i: -i["entry"]["width"])  # largest first, as displayed
+        groups.append({
+            "group_id": group_entry.id,
+            "group_name": str(group_entry.name) if group_entry.name else None,
+            "images": images,
+            # Variant used for the grid thumbnail: the one closest to 64px
+            "_thumb_idx": min(
+                range(len(images)), key=lambda i: abs(images[i]["entry"]["width"] - 64)
+            ) if images else None,
+        })
     return groups
 
 
+def _get_image(item):
+    """Decode an icon variant on first use and memoize it on the item (None if undecodable)."""
+    raw = item["raw"]  # read once: another thread may be decoding the same item
+    if raw is not None:
+        item["image"] = icon_resource_to_image(raw)
+        item["raw"] = None
+    return item["image"]
+
+
 # ---------------------------------------------------------------------------
 # Qt helpers
 # ---------------------------------------------------------------------------
 
 def pil_to_qpixmap(pil_img: Image.Image) -> QPixmap:
-    """Convert PIL RGBA image to QPixmap."""
-    data = pil_img.tobytes("raw", "RGBA")
-    qimg = QImage(data, pil_img.width, pil_img.height, 4 * pil_img.width, QImage.Format.Format_RGBA8888)
+    """Convert PIL RGBA image to QPixmap (premultiplied, as Qt composites)."""
+    # Premultiply once here so Qt does not have to on every blit
+    buf = pil_img.convert("RGBa").tobytes()
+    # The QImage borrows `buf` without copying; `buf` stays alive in this frame
+    # until fromImage() has copied the pixels into the pixmap.
+    qimg = QImage(buf, pil_img.width, pil_img.height, 4 * pil_img.width,
+                  QImage.Format.Format_RGBA8888_Premultiplied)
     return QPixmap.fromImage(qimg)
 
 
+def scale_to_fit(pil_img: Image.Image, size: int) -> Image.Image:
+    """Resize so the longer side is `size`, keeping aspect ratio (no-op if it already is)."""
+    scale = size / max(pil_img.width, pil_img.height)
+    target = (max(1, round(pil_img.width * scale)), max(1, round(pil_img.height * scale)))
+    if target == pil_img.size:
+        return pil_img
+    return pil_img.resize(target, Image.Resampling.LANCZOS)
+
+
 CHECKERBOARD_CSS = """
     background-color: #2a2a3c;
     background-image:
@@ -205,36 +309,112 @@ CHECKERBOARD_CSS = """
     background-position: 0 0, 0 8px, 8px -8px, -8px 0px;
 """
 
+# Rules for the widgets created per icon (detail rows). Installed once with
+# QApplication.setStyleSheet so Qt parses them a single time rather than once
+# per widget; widgets opt in via objectName. Grid cards paint themselves.
+GLOBAL_QSS = """
+    QWidget#gridContainer, QWidget#detailContainer { background: #1e1e2e; }
+
+    QLabel#checker { """ + CHECKERBOARD_CSS + """ border-radius: 4px; }
+
+    QFrame#variantRow { background: #313244; border-radius: 8px; }
+    QLabel#variantDim { color: #cdd6f4; font-size: 13px; background: transparent; }
+    QLabel#variantMeta { color: #a6adc8; font-size: 11px; background: transparent; }
+    QPushButton#exportButton {
+        background: #89b4fa; color: #1e1e2e; border: none;
+        border-radius: 4px; padding: 4px 8px; font-weight: bold; font-size: 11px;
+    }
+    QPushButton#exportButton:hover { background: #b4d0fb; }
+"""
+
+
+@functools.cache
+def checker_tile() -> QPixmap:
+    """16x16 checkerboard tile drawn behind grid icons (built once, after QApplication exists)."""
+    tile = QPixmap(16, 16)
+    tile.fill(QColor("#2a2a3c"))
+    painter = QPainter(tile)
+    painter.fillRect(0, 0, 8, 8, QColor("#353548"))
+    painter.fillRect(8, 8, 8, 8, QColor("#353548"))
+    painter.end()
+    return tile
+
+
+@functools.cache
+def thumbnail_font() -> QFont:
+    font = QFont()
+    font.setPixelSize(10)
+    return font
+
+
+# ---------------------------------------------------------------------------
+# Background thumbnail decoding
+# ---------------------------------------------------------------------------
+
+class ThumbnailSignals(QObject):
+    """Carries results from ThumbnailTask workers back to the GUI thread."""
+
+    # (generation, group index, group)
+    group_ready = pyqtSignal(int, int, object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        # Bumped on every repopulate; tasks from an older generation are stale
+        self.generation = 0
+
+
+class ThumbnailTask(QRunnable):
+    """Decodes and pre-scales one group's grid thumbnail on a pool thread."""
+
+    def __init__(self, signals, generation, index, group):
+        super().__init__()
+        self._signals = signals
+        self._generation = generation
+        self._index = index
+        self._group = group
+
+    def run(self):
+        group = self._group
+        images = group["images"]
+        if group["_thumb_idx"] is None or self._generation != self._signals.generation:
+            return
+        img = _get_image(images[group["_thumb_idx"]])
+        if img is None:
+            # Preferred variant is corrupt: fall back to the next-closest to 64px
+            # (failed variants are memoized as None, so they are not re-decoded)
+            for i in sorted(range(len(images)), key=lambda i: abs(images[i]["entry"]["width"] - 64)):
+                img = _get_image(images[i])
+                if img is not None:
+                    group["_thumb_idx"] = i
+                    break
+            else:
+                return
+        # Scale in PIL so only 64x64 worth of pixels is copied into Qt; the
+        # QPixmap itself must still be created on the GUI thread.
+        group["_thumb_image"] = scale_to_fit(img, 64)
+        if self._generation == self._signals.generation:
+            self._signals.group_ready.emit(self._generation, self._index, group)
+
 
 # ---------------------------------------------------------------------------
 # Widgets
 # ---------------------------------------------------------------------------
 
-class IconThumbnail(QFrame):
-    """Clickable icon card for the grid."""
+class IconThumbnail(QAbstractButton):
+    """Clickable icon card for the grid, painted directly (no child widgets)."""
+
+    WELL = QRect(21, 6, 68, 68)          # checkerboard area behind the icon
+    TEXT_RECT = QRect(6, 76, 98, 38)
 
     def __init__(self, group, pixmap, on_click):
         super().__init__()
         self.group = group
-        self._on_click = on_click
+        self._pixmap = pixmap
         self._selected = False
         self.setCursor(Qt.CursorShape.PointingHandCursor)
         self.setFixedSize(110, 120)
-        self._update_style()
-
-        layout = QVBoxLayout(self)
-        layout.setContentsMargins(6, 6, 6, 6)
-        layout.setSpacing(2)
-
-        img_label = QLabel()
-        img_label.setPixmap(pixmap.scaled(
-            QSize(64, 64), Qt.AspectRatioMode.KeepAspectRatio,
-            Qt.TransformationMode.SmoothTransformation
-        ))
-        img_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        img_label.setStyleSheet(CHECKERBOARD_CSS + "border-radius: 4px;")
-        img_label.setFixedSize(68, 68)
-        layout.addWidget(img_label, alignment=Qt.AlignmentFlag.AlignCenter)
+        self.setAttribute(Qt.WidgetAttribute.WA_Hover)  # repaint on enter/leave
+        self.clicked.connect(lambda: on_click(self))
 
         best = group["images"][0]["entry"] if group["images"] else None
         size_text = f'{best["width"]}x{best["height"]}' if best else "?"
@@ -247,31 +427,47 @@ class IconThumbnail(QFrame):
         else:
             display_name = f'#{group["group_id"]}'
 
-        text_label = QLabel(f'{display_name}\n{size_text}  ({count})')
-        text_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        text_label.setStyleSheet("color: #cdd6f4; font-size: 10px; background: transparent;")
+        self._text = f'{display_name}\n{size_text}  ({count})'
         # Tooltip shows full name and ID
-        tooltip = f'{name or "unnamed"}  (ID: {group["group_id"]})'
-        text_label.setToolTip(tooltip)
-        layout.addWidget(text_label)
-
-    def mousePressEvent(self, event):
-        self._on_click(self)
+        self.setToolTip(f'{name or "unnamed"}  (ID: {group["group_id"]})')
 
     def set_selected(self, selected):
         self._selected = selected
-        self._update_style()
-
-    def _update_style(self):
-        bg = "#585b70" if self._selected else "#313244"
-        self.setStyleSheet(f"""
-            IconThumbnail {{
-                background: {bg}; border-radius: 8px;
-            }}
-            IconThumbnail:hover {{
-                background: {"#585b70" if self._selected else "#45475a"};
-            }}
-        """)
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        if self._selected:
+            bg = "#585b70"
+        elif self.underMouse():
+            bg = "#45475a"
+        else:
+            bg = "#313244"
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(bg))
+        painter.drawRoundedRect(QRectF(self.rect()), 8, 8)
+
+        well = self.WELL
+        clip = QPainterPath()
+        clip.addRoundedRect(QRectF(well), 4, 4)
+        painter.save()
+        painter.setClipPath(clip)
+        painter.drawTiledPixmap(well, checker_tile())
+        painter.restore()
+
+        pix = self._pixmap
+        painter.drawPixmap(
+            well.x() + (well.width() - pix.width()) // 2,
+            well.y() + (well.height() - pix.height()) // 2,
+            pix,
+        )
+
+        painter.setPen(QColor("#cdd6f4"))
+        painter.setFont(thumbnail_font())
+        painter.drawText(self.TEXT_RECT, Qt.AlignmentFlag.AlignCenter, self._text)
+        painter.end()
 
 
 class DetailPanel(QScrollArea):
@@ -283,7 +479,7 @@ class DetailPanel(QScrollArea):
         self.setStyleSheet("QScrollArea { border: none; background: #1e1e2e; }")
 
         self._container = QWidget()
-        self._container.setStyleSheet("background: #1e1e2e;")
+        self._container.setObjectName("detailContainer")
         self._layout = QVBoxLayout(self._container)
         self._layout.setAlignment(Qt.AlignmentFlag.AlignTop)
         self.setWidget(self._container)
@@ -294,40 +490,63 @@ class DetailPanel(QScrollArea):
 
         self._pil_images = []  # keep refs for export
 
-    def show_group(self, group, export_callback):
-        # Clear old rows (keep title)
+    def clear(self):
+        self._clear_rows()
+        self._title.setText("Select an icon")
+
+    def _clear_rows(self):
+        # Remove variant rows (keep title)
         while self._layout.count() > 1:
             item = self._layout.takeAt(1)
             if item.widget():
                 item.widget().deleteLater()
-
         self._pil_images.clear()
 
+    def show_group(self, group, export_callback):
+        # Suspend repaints while rows are rebuilt so layout runs once at the end
+        self.setUpdatesEnabled(False)
+        self._container.setUpdatesEnabled(False)
+        try:
+            self._rebuild_rows(group, export_callback)
+        finally:
+            self._container.setUpdatesEnabled(True)
+            self.setUpdatesEnabled(True)
+
+    def _rebuild_rows(self, group, export_callback):
+        self._clear_rows()
+
+        decoded = [(item, _get_image(item)) for item in group["images"]]
+        failed = sum(1 for _, pil_img in decoded if pil_img is None)
+
         name = group.get("group_name") or f'Icon #{group["group_id"]}'
-        self._title.setText(f'{name}  —  {len(group["images"])} variant(s)')
+        title = f'{name}  —  {len(decoded)} variant(s)'
+        if failed:
+            title += f', {failed} unreadable'
+        self._title.setText(title)
 
-        for item in sorted(group["images"], key=lambda i: -i["entry"]["width"]):
+        for item, pil_img in decoded:
             entry = item["entry"]
-            pil_img = item["image"]
-            self._pil_images.append(pil_img)
 
             row = QFrame()
-            row.setStyleSheet("QFrame { background: #313244; border-radius: 8px; }")
+            row.setObjectName("variantRow")
             row_layout = QHBoxLayout(row)
             row_layout.setContentsMargins(12, 8, 12, 8)
 
             # Icon preview (up to 128px display, checkerboard bg)
             display_size = min(entry["width"], 128)
-            pixmap = pil_to_qpixmap(pil_img)
             img_label = QLabel()
-            img_label.setPixmap(pixmap.scaled(
-                QSize(display_size, display_size),
-                Qt.AspectRatioMode.KeepAspectRatio,
-                Qt.TransformationMode.SmoothTransformation,
-            ))
+            if pil_img is None:
+                img_label.setText("?")
+            else:
+                self._pil_images.append(pil_img)
+                pixmap = item.get("_qpixmap")
+                if pixmap is None:
+                    shown = scale_to_fit(pil_img, display_size)
+                    pixmap = item["_qpixmap"] = pil_to_qpixmap(shown)
+                img_label.setPixmap(pixmap)
             img_label.setFixedSize(display_size + 8, display_size + 8)
             img_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            img_label.setStyleSheet(CHECKERBOARD_CSS + "border-radius: 4px;")
+            img_label.setObjectName("checker")
             row_layout.addWidget(img_label)
 
             # Info
@@ -337,31 +556,31 @@ class DetailPanel(QScrollArea):
             bits = entry["bit_count"]
             depth = f"{bits}-bit" if bits else "?"
             dim_label = QLabel(f'{entry["width"]} \u00d7 {entry["height"]}  |  {depth}')
-            dim_label.setStyleSheet("color: #cdd6f4; font-size: 13px; background: transparent;")
+            dim_label.setObjectName("variantDim")
             info.addWidget(dim_label)
 
-            meta_label = QLabel(f'{entry["bytes_in_res"]:,} bytes  |  resource {entry["icon_id"]}')
-            meta_label.setStyleSheet("color: #a6adc8; font-size: 11px; background: transparent;")
+            meta_text = f'{entry["bytes_in_res"]:,} bytes  |  resource {entry["icon_id"]}'
+            if pil_img is None:
+                meta_text += "  |  could not be decoded"
+            meta_label = QLabel(meta_text)
+            meta_label.setObjectName("variantMeta")
             info.addWidget(meta_label)
 
-            btn = QPushButton("Export PNG")
-            btn.setCursor(Qt.CursorShape.PointingHandCursor)
-            btn.setFixedWidth(100)
-            btn.setStyleSheet("""
-                QPushButton {
-                    background: #89b4fa; color: #1e1e2e; border: none;
-                    border-radius: 4px; padding: 4px 8px; font-weight: bold; font-size: 11px;
-                }
-                QPushButton:hover { background: #b4d0fb; }
-            """)
-            btn.clicked.connect(lambda _, g=group, i=item: export_callback(g, i))
-            info.addWidget(btn, alignment=Qt.AlignmentFlag.AlignLeft)
+            if pil_img is not None:
+                btn = QPushButton("Export PNG")
+                btn.setCursor(Qt.CursorShape.PointingHandCursor)
+                btn.setFixedWidth(100)
+                btn.setObjectName("exportButton")
+                btn.clicked.connect(lambda _, g=group, i=item: export_callback(g, i))
+                info.addWidget(btn, alignment=Qt.AlignmentFlag.AlignLeft)
 
             row_layout.addLayout(info, stretch=1)
             self._layout.addWidget(row)
 
 
 class ICLViewer(QMainWindow):
+    GRID_COLUMNS = 5
+
     def __init__(self, initial_path=None):
         super().__init__()
         self.setWindowTitle("ICL Viewer")
@@ -373,6 +592,11 @@ class ICLViewer(QMainWindow):
         self._cards = []
         self._selected_card = None
 
+        # Parented to the application rather than the window, so pool threads
+        # that finish after the window is gone still emit on a live object
+        self._thumb_signals = ThumbnailSignals(QApplication.instance())
+        self._thumb_signals.group_ready.connect(self._on_group_ready)
+
         self._build_ui()
 
         if initial_path and os.path.isfile(initial_path):
@@ -433,7 +657,7 @@ class ICLViewer(QMainWindow):
         left_scroll.setWidgetResizable(True)
         left_scroll.setStyleSheet("QScrollArea { border: none; background: #1e1e2e; }")
         self._grid_widget = QWidget()
-        self._grid_widget.setStyleSheet("background: #1e1e2e;")
+        self._grid_widget.setObjectName("gridContainer")
         self._grid_layout = QGridLayout(self._grid_widget)
         self._grid_layout.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft)
         self._grid_layout.setSpacing(8)
@@ -480,26 +704,39 @@ class ICLViewer(QMainWindow):
                 item.widget().deleteLater()
         self._cards.clear()
         self._selected_card = None
-
-        cols = 5
+        self._detail.clear()
+
+        # Cards are added by _on_group_ready as each thumbnail finishes decoding;
+        # the new generation makes late results from a previous file stale
+        signals = self._thumb_signals
+        signals.generation += 1
+        pool = QThreadPool.globalInstance()
+        pool.clear()  # drop queued tasks from a previously opened file
         for i, group in enumerate(self._groups):
-            best_img = None
-            best_diff = 99999
-            for item in group["images"]:
-                diff = abs(item["entry"]["width"] - 64)
-                if diff < best_diff:
-                    best_diff = diff
-                    best_img = item["image"]
-            if best_img is None:
-                continue
+            pool.start(ThumbnailTask(signals, signals.generation, i, group))
 
-            pixmap = pil_to_qpixmap(best_img)
-            card = IconThumbnail(group, pixmap, self._on_card_click)
-            self._cards.append(card)
-            self._grid_layout.addWidget(card, i // cols, i % cols)
-
-        if self._cards:
-            self._on_card_click(self._cards[0])
+    def _on_group_ready(self, generation, index, group):
+        if generation != self._thumb_signals.generation:
+            return
+        thumb = group.pop("_thumb_image")  # only needed to build the pixmap
+        pixmap = group.get("_thumb_pixmap")
+        if pixmap is None:
+            pixmap = group["_thumb_pixmap"] = pil_to_qpixmap(thumb)
+        card = IconThumbnail(group, pixmap, self._on_card_click)
+        self._cards.append(card)
+        # Grid cells follow file order, whatever order the decodes finish in
+        self._grid_layout.addWidget(card, index // self.GRID_COLUMNS, index % self.GRID_COLUMNS)
+
+        if self._selected_card is None:
+            self._on_card_click(card)
+
+    def closeEvent(self, event):
+        # Stop thumbnail work before the window (and its slots) go away
+        self._thumb_signals.generation += 1
+        pool = QThreadPool.globalInstance()
+        pool.clear()
+        pool.waitForDone()
+        super().closeEvent(event)
 
     def _on_card_click(self, card):
         if self._selected_card:
@@ -516,7 +753,7 @@ class ICLViewer(QMainWindow):
             self, "Export Icon", default, "PNG Image (*.png);;ICO File (*.ico)"
         )
         if path:
-            item["image"].save(path)
+            _get_image(item).save(path)
 
     def _on_export_all(self):
         if not self._groups:
@@ -524,14 +761,43 @@ class ICLViewer(QMainWindow):
         folder = QFileDialog.getExistingDirectory(self, "Choose export folder")
         if not folder:
             return
-        count = 0
+        out_dir = Path(folder)
+
+        # Keyed by path so a later duplicate name wins, as with a serial loop,
+        # and no two workers ever write the same file.
+        jobs = {}
         for group in self._groups:
+            base_name = group.get("group_name") or f'icon_{group["group_id"]}'
             for item in group["images"]:
                 e = item["entry"]
-                base_name = group.get("group_name") or f'icon_{group["group_id"]}'
-                filename = f'{base_name}_{e["width"]}x{e["height"]}.png'
-                item["image"].save(os.path.join(folder, filename))
-                count += 1
+                jobs[out_dir / f'{base_name}_{e["width"]}x{e["height"]}.png'] = item
+
+        def export(path, item):
+            img = _get_image(item)
+            if img is None:
+                return False
+            # Fast zlib level: PNG encode is the bottleneck, files grow only modestly
+            img.save(path, "PNG", optimize=False, compress_level=1)
+            return True
+
+        progress = QProgressDialog("Exporting icons...", "Cancel", 0, len(jobs), self)
+        progress.setWindowModality(Qt.WindowModality.WindowModal)
+        progress.setMinimumDuration(0)
+
+        # Pillow releases the GIL while encoding, so this scales with cores
+        count = 0
+        executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+        try:
+            futures = [executor.submit(export, path, item) for path, item in jobs.items()]
+            for done, future in enumerate(as_completed(futures), 1):
+                if future.result():
+                    count += 1
+                progress.setValue(done)
+                if progress.wasCanceled():
+                    break
+        finally:
+            executor.shutdown(cancel_futures=True)
+            progress.close()
         QMessageBox.information(self, "Done", f"Exported {count} icon(s) to:\n{folder}")
 
 
@@ -542,6 +808,7 @@ class ICLViewer(QMainWindow):
 if __name__ == "__main__":
     app = QApplication(sys.argv)
     app.setStyle("Fusion")
+    app.setStyleSheet(GLOBAL_QSS)
 
     # Dark palette
     palette = QPalette()